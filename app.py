@@ -1,16 +1,74 @@
-import json
 import os
 import subprocess
-from typing import Dict, Any, Tuple
+import threading
+from typing import Dict, Any, Hashable, Optional, Tuple, Union
+from urllib.parse import urlparse
 
+import msgspec
+import orjson
 import requests
-from flask import Flask, jsonify, render_template, request
+from cachetools import TTLCache
+from flask import Flask, Response, jsonify, render_template, request
+from flask.json.provider import DefaultJSONProvider
+
+from config import ENDPOINTS, HEADERS
+from lib.tests import tests
+from lib.utils import build_paths, build_session, is_graphql, run_tests
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson, falling back to Flask's default provider.
+
+    Only ``sort_keys``, a two-space ``indent`` and compact ``separators`` map
+    onto orjson output. Any other argument, or a value orjson rejects
+    (non-string keys, integers wider than 64 bits), is handled by the
+    stdlib-based default provider.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        supported = (
+            kwargs.keys() <= {"sort_keys", "indent", "separators"}
+            and kwargs.get("indent") in (None, 2)
+            and kwargs.get("separators", (",", ":")) == (",", ":")
+        )
+        if supported:
+            option = 0
+            if kwargs.get("sort_keys", self.sort_keys):
+                option |= orjson.OPT_SORT_KEYS
+            if kwargs.get("indent"):
+                option |= orjson.OPT_INDENT_2
+            try:
+                return orjson.dumps(obj, option=option).decode()
+            except TypeError:
+                pass
+        return super().dumps(obj, **kwargs)
+
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+
+class IntrospectionResponse(msgspec.Struct):
+    """GraphQL response envelope; ``data`` is kept as undecoded JSON."""
+
+    data: msgspec.Raw = msgspec.Raw()
+    errors: Any = msgspec.UNSET
+
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 
-GRAPHQL_COP_SCRIPT = os.getenv("GRAPHQL_COP_SCRIPT", "graphql-cop.py")
 GRAPHW00F_CMD = os.getenv("GRAPHW00F_CMD", "graphw00f")
 
+# Certificate-verified requests carrying the user's headers. Kept apart from
+# lib.utils.SESSION, whose pooled connections are opened with verify=False.
+VERIFIED_SESSION = build_session()
+
+# Serialized successful responses, keyed on (endpoint, target, headers) and
+# bounded by their total size in bytes.
+RESPONSE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+RESPONSE_CACHE: TTLCache = TTLCache(maxsize=RESPONSE_CACHE_MAX_BYTES, ttl=300, getsizeof=len)
+RESPONSE_CACHE_LOCK = threading.Lock()
+
 INTROSPECTION_QUERY = """
 query IntrospectionQuery {
   __schema {
@@ -105,20 +163,46 @@ fragment TypeRef on __Type {
 }
 """
 
+# The introspection request never changes, so encode it once at import time.
+INTROSPECTION_BODY = orjson.dumps({"query": INTROSPECTION_QUERY})
+
 
 def parse_headers(raw_headers: str) -> Dict[str, str]:
     if not raw_headers:
         return {}
-    parsed = json.loads(raw_headers)
+    parsed = orjson.loads(raw_headers)
     if not isinstance(parsed, dict):
         raise ValueError("Headers must be a JSON object")
-    return {str(key): str(value) for key, value in parsed.items()}
+    # JSON object keys are always strings; only non-string values need coercing.
+    if all(isinstance(value, str) for value in parsed.values()):
+        return parsed
+    return {key: value if isinstance(value, str) else str(value) for key, value in parsed.items()}
+
+
+def cached_response(key: Hashable) -> Optional[Response]:
+    if request.args.get("fresh") == "1":
+        return None
+    with RESPONSE_CACHE_LOCK:
+        body = RESPONSE_CACHE.get(key)
+    if body is None:
+        return None
+    return Response(body, mimetype="application/json")
+
+
+def cache_response(key: Hashable, obj: Any) -> Response:
+    body = orjson.dumps(obj)
+    if len(body) <= RESPONSE_CACHE_MAX_BYTES:
+        with RESPONSE_CACHE_LOCK:
+            RESPONSE_CACHE[key] = body
+    return Response(body, mimetype="application/json")
 
 
 def run_command(command: list[str]) -> Tuple[int, str, str]:
     try:
-        process = subprocess.run(command, capture_output=True, text=True)
-        return process.returncode, process.stdout.strip(), process.stderr.strip()
+        process = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        stdout = process.stdout.decode("utf-8", errors="replace")
+        stderr = process.stderr.decode("utf-8", errors="replace")
+        return process.returncode, stdout.strip(), stderr.strip()
     except FileNotFoundError as exc:
         return 127, "", str(exc)
 
@@ -142,21 +226,31 @@ def run_graphql_cop() -> Any:
     except Exception as exc:
         return jsonify({"error": f"invalid headers JSON: {exc}"}), 400
 
-    command = ["python", GRAPHQL_COP_SCRIPT, "-t", target, "-o", "json"]
-    for key, value in headers.items():
-        command.extend(["-H", json.dumps({key: value})])
+    if not urlparse(target).scheme:
+        return jsonify({"error": "target URL is missing a scheme (http:// or https://)"}), 400
 
-    returncode, stdout, stderr = run_command(command)
+    cache_key = ("graphql-cop", target, tuple(sorted(headers.items())))
+    cached = cached_response(cache_key)
+    if cached is not None:
+        return cached
 
-    if returncode != 0:
-        return jsonify({"error": "GraphQL Cop execution failed", "stderr": stderr, "stdout": stdout}), 500
+    cop_headers = {**HEADERS, **headers}
+    paths = build_paths(target, ENDPOINTS)
+    scanned = []
+    findings = []
 
     try:
-        findings = json.loads(stdout)
-    except json.JSONDecodeError:
-        return jsonify({"error": "GraphQL Cop output was not valid JSON", "stdout": stdout, "stderr": stderr}), 500
+        for path in paths:
+            if is_graphql(path, {}, cop_headers, False):
+                scanned.append(path)
+                findings.extend(run_tests(tests.values(), path, {}, cop_headers, False))
+    except Exception as exc:
+        return jsonify({"error": f"GraphQL Cop execution failed: {exc}"}), 500
+
+    if not scanned:
+        return jsonify({"error": f"no GraphQL endpoint detected at {', '.join(paths)}"}), 500
 
-    return jsonify({"findings": findings, "command": " ".join(command)})
+    return cache_response(cache_key, {"findings": sorted(findings, key=lambda d: d["title"])})
 
 
 @app.post("/api/graphw00f")
@@ -195,20 +289,30 @@ def introspection() -> Any:
     except Exception as exc:
         return jsonify({"error": f"invalid headers JSON: {exc}"}), 400
 
+    cache_key = ("introspection", target, tuple(sorted(headers.items())))
+    cached = cached_response(cache_key)
+    if cached is not None:
+        return cached
+
     req_headers = {"Content-Type": "application/json", **headers}
 
     try:
-        response = requests.post(target, headers=req_headers, json={"query": INTROSPECTION_QUERY}, timeout=30)
-        response.raise_for_status()
-    except requests.RequestException as exc:
+        with VERIFIED_SESSION.post(target, headers=req_headers, data=INTROSPECTION_BODY, timeout=30, stream=True) as response:
+            response.raise_for_status()
+            body = response.raw.read(decode_content=True)
+    except (requests.RequestException, requests.packages.urllib3.exceptions.HTTPError) as exc:
         return jsonify({"error": f"Introspection request failed: {exc}"}), 500
 
-    data = response.json()
+    try:
+        result = msgspec.json.decode(body, type=IntrospectionResponse)
+    except msgspec.DecodeError:
+        return jsonify({"error": "Introspection response was not a valid GraphQL JSON response"}), 500
 
-    if "errors" in data:
-        return jsonify({"error": "Introspection returned errors", "details": data["errors"]}), 500
+    if result.errors is not msgspec.UNSET:
+        return jsonify({"error": "Introspection returned errors", "details": result.errors}), 500
 
-    return jsonify({"introspection": data.get("data")})
+    introspection_data = orjson.Fragment(bytes(result.data)) if result.data else None
+    return cache_response(cache_key, {"introspection": introspection_data})
 
 
 if __name__ == "__main__":
@@ -4,3 +4,5 @@ from version import VERSION
 HEADERS = {
     'User-Agent':'graphql-cop/{}'.format(VERSION),
 }
+
+ENDPOINTS = ['/', '/graphiql', '/playground', '/console', '/graphql']
@@ -4,11 +4,11 @@ import sys
 from json import loads, dumps
 from optparse import OptionParser
 from version import VERSION
-from config import HEADERS
+from config import HEADERS, ENDPOINTS
 from urllib.parse import urlparse
 
 from lib.tests import tests
-from lib.utils import is_graphql, draw_art, read_custom_wordlist
+from lib.utils import is_graphql, draw_art, read_custom_wordlist, run_tests, build_paths
 
 from termcolor import colored
 
@@ -91,16 +91,9 @@ else:
 if options.wordlist:
     endpoints = read_custom_wordlist(options.wordlist)
 else:
-    endpoints = ['/', '/graphiql', '/playground', '/console', '/graphql']
+    endpoints = ENDPOINTS
 
-paths = []
-parsed = urlparse(url)
-
-if parsed.path and parsed.path != '/':
-    paths.append(url)
-else:
-     for endpoint in endpoints:
-        paths.append(parsed.scheme + '://' + parsed.netloc + endpoint)
+paths = build_paths(url, endpoints)
 
 json_output = []
 
@@ -111,8 +104,7 @@ for path in paths:
             continue
         else:
             print('Running a forced scan against the endpoint')
-    for test in tests.values():
-        json_output.append(test(path, proxy, HEADERS, options.debug_mode))
+    json_output.extend(run_tests(tests.values(), path, proxy, HEADERS, options.debug_mode))
 
 json_output = sorted(json_output, key=lambda d: d['title']) 
 
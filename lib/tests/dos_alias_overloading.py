@@ -19,7 +19,7 @@ def alias_overloading(url, proxy, headers, debug_mode):
      aliases += 'alias{}:__typename \n'.format(i)
 
   if debug_mode:
-    headers['X-GraphQL-Cop-Test'] = res['title']
+    headers = {**headers, 'X-GraphQL-Cop-Test': res['title']}
   gql_response = graph_query(url, proxies=proxy, headers=headers, payload='query cop { ' + aliases + ' }')
 
   res['curl_verify'] = curlify(gql_response)
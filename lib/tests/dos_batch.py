@@ -15,7 +15,7 @@ def batch_query(url, proxy, headers, debug_mode):
   }
 
   if debug_mode:
-    headers['X-GraphQL-Cop-Test'] = res['title']
+    headers = {**headers, 'X-GraphQL-Cop-Test': res['title']}
   gql_response = graph_query(url, proxies=proxy, headers=headers, payload='query cop { __typename }', batch=True)
   
   res['curl_verify'] = curlify(gql_response)
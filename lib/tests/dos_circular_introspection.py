@@ -15,7 +15,7 @@ def circular_query_introspection(url, proxy, headers, debug_mode):
 
   q = 'query cop { __schema { types { fields { type { fields { type { fields { type { fields { type { name } } } } } } } } } } }'
   if debug_mode:
-    headers['X-GraphQL-Cop-Test'] = res['title']
+    headers = {**headers, 'X-GraphQL-Cop-Test': res['title']}
   gql_response = graph_query(url, proxies=proxy, headers=headers, payload=q)
   res['curl_verify'] = curlify(gql_response)
   try:
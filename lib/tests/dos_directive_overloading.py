@@ -16,7 +16,7 @@ def directive_overloading(url, proxy, headers, debug_mode):
 
   q = 'query cop { __typename @aa@aa@aa@aa@aa@aa@aa@aa@aa@aa }'
   if debug_mode:
-    headers['X-GraphQL-Cop-Test'] = res['title']
+    headers = {**headers, 'X-GraphQL-Cop-Test': res['title']}
   gql_response = graph_query(url, proxies=proxy, headers=headers, payload=q)
   res['curl_verify'] = curlify(gql_response)
 
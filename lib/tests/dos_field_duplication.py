@@ -17,7 +17,7 @@ def field_duplication(url, proxy, headers, debug_mode):
   duplicated_string = '__typename \n' * 500
   q = 'query cop { ' + duplicated_string + '} '
   if debug_mode:
-    headers['X-GraphQL-Cop-Test'] = res['title']
+    headers = {**headers, 'X-GraphQL-Cop-Test': res['title']}
   gql_response = graph_query(url, proxies=proxy, headers=headers, payload=q)
   res['curl_verify'] = curlify(gql_response)
 
@@ -16,7 +16,7 @@ def field_suggestions(url, proxy, headers, debug_mode):
 
   q = 'query cop { __schema { directive } }'
   if debug_mode:
-    headers['X-GraphQL-Cop-Test'] = res['title']
+    headers = {**headers, 'X-GraphQL-Cop-Test': res['title']}
   gql_response = graph_query(url, proxies=proxy, headers=headers, payload=q)
   res['curl_verify'] = curlify(gql_response)
 
@@ -15,7 +15,7 @@ def get_based_mutation(url, proxies, headers, debug_mode):
 
   q = 'mutation cop {__typename}'
   if debug_mode:
-    headers['X-GraphQL-Cop-Test'] = res['title']
+    headers = {**headers, 'X-GraphQL-Cop-Test': res['title']}
   response = request(url, proxies=proxies, headers=headers, params={'query':q})
   res['curl_verify'] = curlify(response)
   try:
@@ -15,9 +15,7 @@ def detect_graphiql(url, proxy, headers, debug_mode):
 
   heuristics = ('graphiql.min.css', 'GraphQL Playground', 'GraphiQL', 'graphql-playground')
 
-  if "Accept" in headers.keys():
-    backup_accept_header=headers["Accept"]
-  headers["Accept"]= "text/html"
+  headers = {**headers, 'Accept': 'text/html'}
   if debug_mode:
       headers['X-GraphQL-Cop-Test'] = res['title']
   response = request(url, proxies=proxy, headers=headers)
@@ -28,8 +26,4 @@ def detect_graphiql(url, proxy, headers, debug_mode):
   except:
       pass
 
-  del headers["Accept"]
-  if 'backup_accept_header' in locals():
-    headers["Accept"]=backup_accept_header
-
   return res
@@ -16,7 +16,7 @@ def introspection(url, proxy, headers, debug_mode):
 
   q = 'query cop { __schema { types { name fields { name } } } }'
   if debug_mode:
-    headers['X-GraphQL-Cop-Test'] = res['title']
+    headers = {**headers, 'X-GraphQL-Cop-Test': res['title']}
   gql_response = graph_query(url, proxies=proxy, headers=headers, payload=q)
   res['curl_verify'] = curlify(gql_response)
   try:
@@ -15,7 +15,7 @@ def post_based_csrf(url, proxies, headers, debug_mode):
 
   q = 'query cop { __typename }'
   if debug_mode:
-    headers['X-GraphQL-Cop-Test'] = res['title']
+    headers = {**headers, 'X-GraphQL-Cop-Test': res['title']}
   response = request(url, proxies=proxies, headers=headers, data={'query': q}, verb='POST')
   res['curl_verify'] = curlify(response)
 
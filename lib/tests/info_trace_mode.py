@@ -18,12 +18,13 @@ def trace_mode(url, proxy, headers, debug_mode):
 
   try:
     if debug_mode:
-      headers['X-GraphQL-Cop-Test'] = res['title']
+      headers = {**headers, 'X-GraphQL-Cop-Test': res['title']}
     gql_response = graph_query(url, proxies=proxy, headers=headers, payload=q)
     res['curl_verify'] = curlify(gql_response)
-    if gql_response.json()['errors'][0]['extensions']['tracing']:
+    body = gql_response.json()
+    if body['errors'][0]['extensions']['tracing']:
       res['result'] = True
-    elif '\'extensions\': {\'tracing\':' in str(gql_response.json()).lower():
+    elif '\'extensions\': {\'tracing\':' in str(body).lower():
       res['result'] = True
   except:
     pass
@@ -18,12 +18,13 @@ def unhandled_error_detection(url, proxy, headers, debug_mode):
 
   try:
     if debug_mode:
-      headers['X-GraphQL-Cop-Test'] = res['title']
+      headers = {**headers, 'X-GraphQL-Cop-Test': res['title']}
     gql_response = graph_query(url, proxies=proxy, headers=headers, payload=q)
     res['curl_verify'] = curlify(gql_response)
-    if gql_response.json()['errors'][0]['extensions']['exception']:
+    body = gql_response.json()
+    if body['errors'][0]['extensions']['exception']:
       res['result'] = True
-    elif '\'extensions\': {\'exception\':' in str(gql_response.json()).lower():
+    elif '\'extensions\': {\'exception\':' in str(body).lower():
       res['result'] = True
   except:
     pass
@@ -1,12 +1,30 @@
 """Helper parts for graphql-cop."""
 import os
 
+from concurrent.futures import ThreadPoolExecutor
+from http.cookiejar import DefaultCookiePolicy
+from types import MappingProxyType
+from urllib.parse import urlparse
+
 import requests
+from requests.adapters import HTTPAdapter
 from simplejson import JSONDecodeError
 from version import VERSION
 
 requests.packages.urllib3.disable_warnings()
 
+def build_session():
+  """Create a pooled session that never stores cookies."""
+  session = requests.Session()
+  session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+  session.mount('http://', HTTPAdapter(pool_connections=32, pool_maxsize=32))
+  session.mount('https://', HTTPAdapter(pool_connections=32, pool_maxsize=32))
+  return session
+
+# Shared by the tests, which always send verify=False. Requests that need
+# certificate checks must use their own session so the pools never mix.
+SESSION = build_session()
+
 def curlify(obj):
   req = obj.request
   command = "curl -X {method} -H {headers} -d '{data}' '{uri}'"
@@ -42,7 +60,7 @@ def graph_query(url, proxies, headers, operation='query', payload={}, batch=Fals
   else:
     data = {operation:payload, "operationName":"cop"}
   try:
-    response = requests.post(url,
+    response = SESSION.post(url,
                             headers=headers,
                             cookies=None,
                             verify=False,
@@ -58,7 +76,7 @@ def graph_query(url, proxies, headers, operation='query', payload={}, batch=Fals
 def request(url, proxies, headers, params=None, data=None, verb='GET'):
   """Perform requests."""
   try:
-    response = requests.request(verb,
+    response = SESSION.request(verb,
                             url=url,
                             params=params,
                             headers=headers,
@@ -77,7 +95,7 @@ def request(url, proxies, headers, params=None, data=None, verb='GET'):
 def is_graphql(url, proxies, headers, debug_mode):
   """Check if the URL provides a GraphQL interface."""
   if debug_mode:
-    headers['X-GraphQL-Cop-Test'] = 'Looking for GraphQL Interface'
+    headers = {**headers, 'X-GraphQL-Cop-Test': 'Looking for GraphQL Interface'}
   query = '''
     query cop {
       __typename
@@ -86,22 +104,36 @@ def is_graphql(url, proxies, headers, debug_mode):
   response = graph_query(url, proxies, headers, payload=query)
 
   try:
-    response.json()
+    body = response.json()
   except AttributeError:
     return False
   except JSONDecodeError:
     return False
 
-  if 'data' in response.json() and response.json()['data'] != None:
-    if response.json()['data']['__typename'] in ('Query', 'QueryRoot', 'query_root', 'Root'):
+  if 'data' in body and body['data'] != None:
+    if body['data']['__typename'] in ('Query', 'QueryRoot', 'query_root', 'Root'):
       return True
-  elif response.json().get('errors') and (any('locations' in i for i in response.json()['errors']) or (any('extensions' in i for i in response.json()))):
+  elif body.get('errors') and (any('locations' in i for i in body['errors']) or (any('extensions' in i for i in body))):
     return True
-  elif response.json().get('data'):
+  elif body.get('data'):
     return True
   else:
     return False
 
+def build_paths(url, endpoints):
+  """Expand a bare host into the endpoints to probe."""
+  parsed = urlparse(url)
+  if parsed.path and parsed.path != '/':
+    return [url]
+  return [parsed.scheme + '://' + parsed.netloc + endpoint for endpoint in endpoints]
+
+def run_tests(tests, url, proxies, headers, debug_mode):
+  """Run the tests concurrently against a single URL."""
+  # Tests share one read-only view of the headers and copy it before adding their own.
+  headers = MappingProxyType(headers)
+  with ThreadPoolExecutor(max_workers=16) as executor:
+    return list(executor.map(lambda test: test(url, proxies, headers, debug_mode), tests))
+
 def draw_art():
   """Create banner."""
   return '''